@@ -5,10 +5,13 @@ Configuration module for S3 Event Forwarder
 Handles loading and managing destination configurations for SQS queues and SNS topics.
 """
 
+import copy
 import json
 import os
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from jsonutil import json_loads
 
 logger = logging.getLogger()
 
@@ -31,32 +34,85 @@ DEFAULT_CONFIG = {
     ]
 }
 
+# Candidate config file locations, in priority order
+_CONFIG_FILE_CANDIDATES = ('/tmp/s3-forwarder-config.json', './config.json', './s3-forwarder-config.json')
+
+# Parsed configuration cached across warm invocations
+_CONFIG_CACHE: Optional[Dict[str, Any]] = None
+_CONFIG_KEY: Optional[tuple] = None
+
 def get_destinations_config() -> Dict[str, Any]:
-    """Get destinations configuration with fallback to defaults."""
+    """Get destinations configuration with fallback to defaults.
+
+    The parsed configuration is cached and only reloaded when the relevant
+    environment variables or config file modification times change. The
+    returned dict is shared across invocations: treat it as read-only.
+    """
+    global _CONFIG_CACHE, _CONFIG_KEY
+    
+    key = _cache_key()
+    if _CONFIG_CACHE is not None and key == _CONFIG_KEY:
+        return _CONFIG_CACHE
+    
     try:
-        # Try environment variables first
-        config = _load_from_env()
-        if config:
-            logger.info("Loaded configuration from environment variables")
-            return _ensure_structure(config)
-        
-        # Try config file
-        config = _load_from_file()
-        if config:
-            logger.info("Loaded configuration from config file")
-            return _ensure_structure(config)
-        
-        # Use default configuration
-        logger.info("Using default configuration")
-        return DEFAULT_CONFIG
-        
+        config = _load_config()
     except Exception as e:
-        logger.error(f"Error loading configuration: {str(e)}")
-        return DEFAULT_CONFIG
+        logger.error("Error loading configuration: %s", e)
+        return _ensure_structure(copy.deepcopy(DEFAULT_CONFIG))
+    
+    logger.info("Enabled destinations: %d SQS queues, %d SNS topics", len(config['sqs_enabled']), len(config['sns_enabled']))
+    _CONFIG_CACHE = config
+    _CONFIG_KEY = key
+    return config
+
+def _load_config() -> Dict[str, Any]:
+    """Load configuration from environment, config file or defaults."""
+    # Try environment variables first
+    config = _load_from_env()
+    if config:
+        logger.info("Loaded configuration from environment variables")
+        return _ensure_structure(config)
+    
+    # Try config file
+    config = _load_from_file()
+    if config:
+        logger.info("Loaded configuration from config file")
+        return _ensure_structure(config)
+    
+    # Use default configuration
+    logger.info("Using default configuration")
+    return _ensure_structure(copy.deepcopy(DEFAULT_CONFIG))
+
+def _cache_key() -> tuple:
+    """Build the cache key from configuration env vars and config file mtimes."""
+    return (
+        os.environ.get('S3_FORWARDER_CONFIG'),
+        os.environ.get('S3_FORWARDER_SQS_QUEUES'),
+        os.environ.get('S3_FORWARDER_SNS_TOPICS'),
+        _config_file_state()
+    )
+
+def _config_file_state() -> tuple:
+    """Get the modification time of each config file candidate (None if missing)."""
+    state: List[Optional[float]] = []
+    for config_file in _CONFIG_FILE_CANDIDATES:
+        try:
+            state.append(os.stat(config_file).st_mtime)
+        except OSError:
+            state.append(None)
+    return tuple(state)
+
+def _reset_cache() -> None:
+    """Clear the cached configuration (used by tests)."""
+    global _CONFIG_CACHE, _CONFIG_KEY
+    _CONFIG_CACHE = None
+    _CONFIG_KEY = None
 
 def _ensure_structure(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Ensure configuration has required structure with empty arrays if missing."""
-    config = config.copy()
+    """Ensure configuration has required structure with empty arrays if missing.
+
+    The config is normalized in place; it is owned by the module cache afterwards.
+    """
     config.setdefault('sqs_queues', [])
     config.setdefault('sns_topics', [])
     
@@ -66,38 +122,53 @@ def _ensure_structure(config: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(config['sns_topics'], list):
         config['sns_topics'] = []
     
+    # Pre-filter enabled destinations (enabled defaults to True if not specified)
+    config['sqs_enabled'] = _enabled_entries(config['sqs_queues'], 'SQS queue')
+    config['sns_enabled'] = _enabled_entries(config['sns_topics'], 'SNS topic')
+    
     return config
 
+def _enabled_entries(destinations: List[Any], label: str) -> List[Dict[str, Any]]:
+    """Get enabled destination entries, skipping malformed (non-object) ones."""
+    enabled = []
+    for destination in destinations:
+        if not isinstance(destination, dict):
+            logger.warning("Skipping invalid %s entry: %r", label, destination)
+        elif destination.get('enabled', True):
+            enabled.append(destination)
+    return enabled
+
 def _load_from_env() -> Optional[Dict[str, Any]]:
     """Load configuration from environment variables."""
     try:
         # Full configuration
-        if 'S3_FORWARDER_CONFIG' in os.environ:
-            return json.loads(os.environ['S3_FORWARDER_CONFIG'])
+        raw = os.environ.get('S3_FORWARDER_CONFIG')
+        if raw:
+            return json_loads(raw)
         
         # Individual configurations
         config = {}
-        if 'S3_FORWARDER_SQS_QUEUES' in os.environ:
-            config['sqs_queues'] = json.loads(os.environ['S3_FORWARDER_SQS_QUEUES'])
-        if 'S3_FORWARDER_SNS_TOPICS' in os.environ:
-            config['sns_topics'] = json.loads(os.environ['S3_FORWARDER_SNS_TOPICS'])
+        raw = os.environ.get('S3_FORWARDER_SQS_QUEUES')
+        if raw:
+            config['sqs_queues'] = json_loads(raw)
+        raw = os.environ.get('S3_FORWARDER_SNS_TOPICS')
+        if raw:
+            config['sns_topics'] = json_loads(raw)
         
         return config if config else None
         
     except (json.JSONDecodeError, Exception) as e:
-        logger.error(f"Error loading from environment: {str(e)}")
+        logger.error("Error loading from environment: %s", e)
         return None
 
 def _load_from_file() -> Optional[Dict[str, Any]]:
     """Load configuration from config file."""
-    config_files = ['/tmp/s3-forwarder-config.json', './config.json', './s3-forwarder-config.json']
-    
-    for config_file in config_files:
+    for config_file in _CONFIG_FILE_CANDIDATES:
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    return json.load(f)
+                with open(config_file, 'rb') as f:
+                    return json_loads(f.read())
         except (json.JSONDecodeError, Exception) as e:
-            logger.error(f"Error loading from {config_file}: {str(e)}")
+            logger.error("Error loading from %s: %s", config_file, e)
     
-    return None 
\ No newline at end of file
+    return None
\ No newline at end of file
@@ -17,6 +17,7 @@ S3_BUCKET_NAME=""
 S3_EVENT_PREFIX=""
 S3_EVENT_SUFFIX=""
 S3_EVENTS="s3:ObjectCreated:*,s3:ObjectRemoved:*"
+COMPILE_MYPYC=false
 
 # Colors for output
 RED='\033[0;31m'
@@ -56,6 +57,8 @@ OPTIONS:
     -e, --events EVENTS        S3 events to trigger Lambda (default: s3:ObjectCreated:*,s3:ObjectRemoved:*)
     -r, --region REGION        AWS region (default: us-east-1)
     -n, --environment ENV      Environment name (default: prod)
+    -c, --compile              Compile modules with mypyc (build host must match the
+                               Lambda runtime: Linux x86_64, Python 3.12)
     -h, --help                 Display this help message
 
 EXAMPLES:
@@ -71,6 +74,9 @@ EXAMPLES:
     # Deploy to different region and environment
     $0 -b my-s3-bucket -r us-west-2 -n staging
 
+    # Deploy with mypyc-compiled modules
+    $0 -b my-s3-bucket -c
+
 EOF
 }
 
@@ -97,13 +103,29 @@ check_prerequisites() {
     fi
     
     # Check if required files exist
-    for file in main.py config.py destinations.py requirements.txt; do
+    for file in main.py config.py destinations.py jsonutil.py requirements.txt; do
         if [ ! -f "$file" ]; then
             error "Required file $file not found in current directory."
             exit 1
         fi
     done
     
+    # Check the build host matches the Lambda runtime when compiling
+    if [ "$COMPILE_MYPYC" = true ]; then
+        if ! python3 -c 'import sys; sys.exit(sys.version_info[:2] != (3, 12))' &> /dev/null; then
+            error "--compile requires python3 to be Python 3.12 to match the Lambda runtime."
+            exit 1
+        fi
+        if [ "$(uname -s)" != "Linux" ] || [ "$(uname -m)" != "x86_64" ]; then
+            error "--compile requires a Linux x86_64 build host to match the Lambda runtime."
+            exit 1
+        fi
+        if ! python3 -c 'import mypyc' &> /dev/null; then
+            error "mypyc is not installed for python3. Install it with 'python3 -m pip install mypy' or deploy without --compile."
+            exit 1
+        fi
+    fi
+    
     success "Prerequisites check passed"
 }
 
@@ -137,12 +159,22 @@ package_lambda() {
     cp main.py "$TEMP_DIR/"
     cp config.py "$TEMP_DIR/"
     cp destinations.py "$TEMP_DIR/"
+    cp jsonutil.py "$TEMP_DIR/"
     cp requirements.txt "$TEMP_DIR/"
     
     # Install dependencies
     if [ -f requirements.txt ]; then
         log "Installing Python dependencies..."
-        pip install -r requirements.txt -t "$TEMP_DIR" --quiet
+        # Install wheels built for the Lambda runtime (orjson is a native extension)
+        pip install -r requirements.txt -t "$TEMP_DIR" --quiet \
+            --platform manylinux2014_x86_64 --only-binary=:all: \
+            --python-version 3.12 --implementation cp
+    fi
+    
+    # Compile modules to native extensions; the .py sources stay as fallback
+    if [ "$COMPILE_MYPYC" = true ]; then
+        log "Compiling Lambda modules with mypyc..."
+        (cd "$TEMP_DIR" && python3 -m mypyc --ignore-missing-imports main.py config.py destinations.py jsonutil.py > /dev/null && rm -rf build .mypy_cache)
     fi
     
     # Create ZIP file
@@ -317,6 +349,10 @@ main() {
                 ENVIRONMENT="$2"
                 shift 2
                 ;;
+            -c|--compile)
+                COMPILE_MYPYC=true
+                shift
+                ;;
             -h|--help)
                 usage
                 exit 0
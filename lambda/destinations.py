@@ -5,22 +5,38 @@ Destinations module for S3 Event Forwarder
 Handles forwarding S3 events to SQS queues and SNS topics.
 """
 
-import json
 import logging
 import boto3
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from jsonutil import json_dumps
+
 logger = logging.getLogger()
 
+class S3Event(NamedTuple):
+    """S3 event details extracted from an incoming Lambda event."""
+    eventName: Optional[str]
+    bucketName: Optional[str]
+    objectKey: Optional[str]
+    eventTime: Optional[str]
+    eventSource: str
+    awsRegion: Optional[str]
+    rawEvent: Optional[Dict[str, Any]] = None
+
 class DestinationForwarder:
     """Handles forwarding events to AWS destinations."""
     
-    def __init__(self):
-        self.sqs_client = boto3.client('sqs')
-        self.sns_client = boto3.client('sns')
+    def __init__(self, max_pool_connections: int = 10):
+        # One session and eagerly built clients, reused for the container lifetime;
+        # the connection pool is sized for concurrent forwarding
+        self.session = boto3.session.Session()
+        client_config = Config(max_pool_connections=max_pool_connections)
+        self.sqs_client = self.session.client('sqs', config=client_config)
+        self.sns_client = self.session.client('sns', config=client_config)
     
-    def forward_to_sqs(self, s3_event: Dict[str, Any], queue_config: Dict[str, Any]) -> Dict[str, Any]:
+    def forward_to_sqs(self, s3_event: S3Event, queue_config: Dict[str, Any]) -> Dict[str, Any]:
         """Forward S3 event to SQS queue."""
         try:
             queue_url = queue_config.get('url')
@@ -32,11 +48,11 @@ class DestinationForwarder:
             message_body = self._prepare_sqs_message(s3_event, queue_config)
             response = self.sqs_client.send_message(
                 QueueUrl=queue_url,
-                MessageBody=json.dumps(message_body),
+                MessageBody=json_dumps(message_body),
                 MessageAttributes=self._get_sqs_attributes(s3_event)
             )
             
-            logger.info(f"Successfully forwarded to SQS queue {queue_name}. Message ID: {response.get('MessageId')}")
+            logger.info("Successfully forwarded to SQS queue %s. Message ID: %s", queue_name, response.get('MessageId'))
             return {'success': True, 'message_id': response.get('MessageId')}
             
         except ClientError as e:
@@ -48,7 +64,7 @@ class DestinationForwarder:
             logger.error(error_msg)
             return {'success': False, 'error': error_msg}
     
-    def forward_to_sns(self, s3_event: Dict[str, Any], topic_config: Dict[str, Any]) -> Dict[str, Any]:
+    def forward_to_sns(self, s3_event: S3Event, topic_config: Dict[str, Any]) -> Dict[str, Any]:
         """Forward S3 event to SNS topic."""
         try:
             topic_arn = topic_config.get('arn')
@@ -60,12 +76,12 @@ class DestinationForwarder:
             message_body = self._prepare_sns_message(s3_event, topic_config)
             response = self.sns_client.publish(
                 TopicArn=topic_arn,
-                Message=json.dumps(message_body),
-                Subject=f"S3 Event: {s3_event.get('eventName', 'Unknown')} - {s3_event.get('bucketName', 'Unknown')}",
+                Message=json_dumps(message_body),
+                Subject=f"S3 Event: {s3_event.eventName} - {s3_event.bucketName}",
                 MessageAttributes=self._get_sns_attributes(s3_event)
             )
             
-            logger.info(f"Successfully forwarded to SNS topic {topic_name}. Message ID: {response.get('MessageId')}")
+            logger.info("Successfully forwarded to SNS topic %s. Message ID: %s", topic_name, response.get('MessageId'))
             return {'success': True, 'message_id': response.get('MessageId')}
             
         except ClientError as e:
@@ -77,54 +93,54 @@ class DestinationForwarder:
             logger.error(error_msg)
             return {'success': False, 'error': error_msg}
     
-    def _prepare_sqs_message(self, s3_event: Dict[str, Any], queue_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_sqs_message(self, s3_event: S3Event, queue_config: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare message body for SQS."""
         return {
             'event_type': 's3_event',
-            'event_name': s3_event.get('eventName'),
-            'bucket_name': s3_event.get('bucketName'),
-            'object_key': s3_event.get('objectKey'),
-            'event_time': s3_event.get('eventTime'),
-            'event_source': s3_event.get('eventSource'),
-            'aws_region': s3_event.get('awsRegion'),
+            'event_name': s3_event.eventName,
+            'bucket_name': s3_event.bucketName,
+            'object_key': s3_event.objectKey,
+            'event_time': s3_event.eventTime,
+            'event_source': s3_event.eventSource,
+            'aws_region': s3_event.awsRegion,
             'destination_type': 'sqs',
             'destination_name': queue_config.get('name'),
             'destination_url': queue_config.get('url'),
-            'raw_event': s3_event.get('rawEvent', {}),
-            'timestamp': s3_event.get('eventTime')
+            'raw_event': s3_event.rawEvent or {},
+            'timestamp': s3_event.eventTime
         }
     
-    def _prepare_sns_message(self, s3_event: Dict[str, Any], topic_config: Dict[str, Any]) -> Dict[str, Any]:
+    def _prepare_sns_message(self, s3_event: S3Event, topic_config: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare message body for SNS."""
         return {
             'event_type': 's3_event',
-            'event_name': s3_event.get('eventName'),
-            'bucket_name': s3_event.get('bucketName'),
-            'object_key': s3_event.get('objectKey'),
-            'event_time': s3_event.get('eventTime'),
-            'event_source': s3_event.get('eventSource'),
-            'aws_region': s3_event.get('awsRegion'),
+            'event_name': s3_event.eventName,
+            'bucket_name': s3_event.bucketName,
+            'object_key': s3_event.objectKey,
+            'event_time': s3_event.eventTime,
+            'event_source': s3_event.eventSource,
+            'aws_region': s3_event.awsRegion,
             'destination_type': 'sns',
             'destination_name': topic_config.get('name'),
             'destination_arn': topic_config.get('arn'),
-            'raw_event': s3_event.get('rawEvent', {}),
-            'timestamp': s3_event.get('eventTime')
+            'raw_event': s3_event.rawEvent or {},
+            'timestamp': s3_event.eventTime
         }
     
-    def _get_sqs_attributes(self, s3_event: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_sqs_attributes(self, s3_event: S3Event) -> Dict[str, Any]:
         """Get SQS message attributes."""
         return {
-            'EventType': {'StringValue': s3_event.get('eventName', 'Unknown'), 'DataType': 'String'},
-            'BucketName': {'StringValue': s3_event.get('bucketName', 'Unknown'), 'DataType': 'String'},
-            'ObjectKey': {'StringValue': s3_event.get('objectKey', 'Unknown'), 'DataType': 'String'},
-            'EventTime': {'StringValue': s3_event.get('eventTime', 'Unknown'), 'DataType': 'String'}
+            'EventType': {'StringValue': s3_event.eventName, 'DataType': 'String'},
+            'BucketName': {'StringValue': s3_event.bucketName, 'DataType': 'String'},
+            'ObjectKey': {'StringValue': s3_event.objectKey, 'DataType': 'String'},
+            'EventTime': {'StringValue': s3_event.eventTime, 'DataType': 'String'}
         }
     
-    def _get_sns_attributes(self, s3_event: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_sns_attributes(self, s3_event: S3Event) -> Dict[str, Any]:
         """Get SNS message attributes."""
         return {
-            'EventType': {'StringValue': s3_event.get('eventName', 'Unknown'), 'DataType': 'String'},
-            'BucketName': {'StringValue': s3_event.get('bucketName', 'Unknown'), 'DataType': 'String'},
-            'ObjectKey': {'StringValue': s3_event.get('objectKey', 'Unknown'), 'DataType': 'String'},
-            'EventTime': {'StringValue': s3_event.get('eventTime', 'Unknown'), 'DataType': 'String'}
+            'EventType': {'StringValue': s3_event.eventName, 'DataType': 'String'},
+            'BucketName': {'StringValue': s3_event.bucketName, 'DataType': 'String'},
+            'ObjectKey': {'StringValue': s3_event.objectKey, 'DataType': 'String'},
+            'EventTime': {'StringValue': s3_event.eventTime, 'DataType': 'String'}
         } 
\ No newline at end of file
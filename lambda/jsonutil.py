@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+JSON helpers for S3 Event Forwarder
+
+Uses orjson (C-backed parser/encoder) when available, falling back to the standard json module.
+"""
+
+import json
+import logging
+from typing import Any, Union
+
+logger = logging.getLogger()
+
+try:
+    import orjson
+except ImportError:  # Local runs without the deployment package
+    orjson = None  # type: ignore[assignment]
+    logger.warning("orjson is not available; falling back to the standard json module")
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from text or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string without ASCII escaping."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
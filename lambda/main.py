@@ -5,146 +5,187 @@ S3 Event Forwarder Lambda Function
 Forwards S3 events to SQS queues and SNS topics based on configuration.
 """
 
-import json
 import logging
-from typing import Dict, Any, Optional
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from config import get_destinations_config
-from destinations import DestinationForwarder
+from destinations import DestinationForwarder, S3Event
+from jsonutil import json_dumps
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-forwarder = DestinationForwarder()
+# Include the extracted event in success responses (S3_FORWARDER_ECHO_EVENT=1)
+ECHO_EVENT = os.environ.get('S3_FORWARDER_ECHO_EVENT') == '1'
+
+SUCCESS_MESSAGE = 'S3 event forwarded successfully'
+
+# Maximum number of destinations forwarded to concurrently
+MAX_FORWARD_WORKERS = 16
+
+# Shared across warm invocations; HTTP pool matches the worker count
+forwarder = DestinationForwarder(max_pool_connections=MAX_FORWARD_WORKERS)
+
+# Kept alive across warm invocations; forwarding is network-bound
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_FORWARD_WORKERS)
+
+# Shared read-only default for missing nested sections
+_EMPTY: Dict[str, Any] = {}
+
+# Builds an S3Event from one incoming event format
+_Extractor = Callable[[Dict[str, Any]], S3Event]
+
+def _extract_records(event: Dict[str, Any]) -> Optional[S3Event]:
+    """Extract details from the first S3 record of a direct S3 event."""
+    for record in event['Records']:
+        if record.get('eventSource') == 'aws:s3':
+            s3 = record['s3']
+            return S3Event(
+                eventName=record['eventName'],
+                bucketName=s3['bucket']['name'],
+                objectKey=s3['object']['key'],
+                eventTime=record['eventTime'],
+                eventSource=record['eventSource'],
+                awsRegion=record['awsRegion'],
+                rawEvent=record
+            )
+    return None
+
+def _extract_cloudwatch(event: Dict[str, Any]) -> S3Event:
+    """Extract details from a CloudWatch Events S3 event."""
+    detail = event.get('detail', _EMPTY)
+    return S3Event(
+        eventName='ObjectCreated:Put',
+        bucketName=detail.get('bucket', _EMPTY).get('name'),
+        objectKey=detail.get('object', _EMPTY).get('key'),
+        eventTime=event.get('time'),
+        eventSource='aws:s3',
+        awsRegion=event.get('region'),
+        rawEvent=event
+    )
+
+def _extract_eventbridge(event: Dict[str, Any]) -> S3Event:
+    """Extract details from an EventBridge S3 event."""
+    detail = event.get('detail', _EMPTY)
+    request_parameters = detail.get('requestParameters', _EMPTY)
+    return S3Event(
+        eventName=detail.get('eventName', 'Unknown'),
+        bucketName=request_parameters.get('bucketName'),
+        objectKey=request_parameters.get('key'),
+        eventTime=event.get('time'),
+        eventSource='aws.s3',
+        awsRegion=event.get('region'),
+        rawEvent=event
+    )
+
+# Extractors for events without Records, by detail-type and then by source
+_DETAIL_TYPE_EXTRACTORS: Dict[str, _Extractor] = {
+    'Object Created:Put': _extract_cloudwatch
+}
+_SOURCE_EXTRACTORS: Dict[str, _Extractor] = {
+    'aws.s3': _extract_eventbridge
+}
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Main Lambda handler for S3 event forwarding."""
     try:
-        logger.info(f"Received event: {json.dumps(event)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Received event: %s", json_dumps(event))
         
         # Extract S3 event details
         s3_event = extract_s3_event(event)
         if not s3_event:
-            return {'statusCode': 400, 'body': json.dumps({'error': 'No valid S3 event found'})}
+            return {'statusCode': 400, 'body': json_dumps({'error': 'No valid S3 event found'})}
         
-        logger.info(f"Processing S3 event: {s3_event['eventName']} for bucket: {s3_event['bucketName']}")
+        logger.info("Processing S3 event: %s for bucket: %s", s3_event.eventName, s3_event.bucketName)
         
         # Get and validate configuration
         config = get_destinations_config()
         if not config:
-            return {'statusCode': 500, 'body': json.dumps({'error': 'Failed to load configuration'})}
+            return {'statusCode': 500, 'body': json_dumps({'error': 'Failed to load configuration'})}
         
         # Forward event to destinations
         results = forward_to_destinations(s3_event, config)
         
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'message': 'S3 event forwarded successfully',
-                'results': results,
-                'event': s3_event
-            })
-        }
+        body = {'message': SUCCESS_MESSAGE, 'results': results}
+        if ECHO_EVENT:
+            event_details = s3_event._asdict()
+            del event_details['rawEvent']
+            body['event'] = event_details
+        
+        return {'statusCode': 200, 'body': json_dumps(body)}
         
     except Exception as e:
-        logger.error(f"Error processing S3 event: {str(e)}", exc_info=True)
-        return {'statusCode': 500, 'body': json.dumps({'error': str(e)})}
+        logger.error("Error processing S3 event: %s", e, exc_info=True)
+        return {'statusCode': 500, 'body': json_dumps({'error': str(e)})}
 
-def extract_s3_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def extract_s3_event(event: Dict[str, Any]) -> Optional[S3Event]:
     """Extract S3 event details from various event formats."""
     try:
-        # Direct S3 event
+        # Direct S3 events carry Records; otherwise dispatch on detail-type, then source
         if 'Records' in event:
-            for record in event['Records']:
-                if record.get('eventSource') == 'aws:s3':
-                    return {
-                        'eventName': record['eventName'],
-                        'bucketName': record['s3']['bucket']['name'],
-                        'objectKey': record['s3']['object']['key'],
-                        'eventTime': record['eventTime'],
-                        'eventSource': record['eventSource'],
-                        'awsRegion': record['awsRegion'],
-                        'rawEvent': record
-                    }
-        
-        # CloudWatch Events S3 event
-        elif 'detail-type' in event and event['detail-type'] == 'Object Created:Put':
-            detail = event.get('detail', {})
-            return {
-                'eventName': 'ObjectCreated:Put',
-                'bucketName': detail.get('bucket', {}).get('name'),
-                'objectKey': detail.get('object', {}).get('key'),
-                'eventTime': event.get('time'),
-                'eventSource': 'aws:s3',
-                'awsRegion': event.get('region'),
-                'rawEvent': event
-            }
+            s3_event = _extract_records(event)
+        else:
+            extractor = _lookup_extractor(_DETAIL_TYPE_EXTRACTORS, event.get('detail-type'))
+            if extractor is None:
+                extractor = _lookup_extractor(_SOURCE_EXTRACTORS, event.get('source'))
+            s3_event = extractor(event) if extractor else None
         
-        # EventBridge S3 event
-        elif 'source' in event and event['source'] == 'aws.s3':
-            detail = event.get('detail', {})
-            return {
-                'eventName': detail.get('eventName', 'Unknown'),
-                'bucketName': detail.get('requestParameters', {}).get('bucketName'),
-                'objectKey': detail.get('requestParameters', {}).get('key'),
-                'eventTime': event.get('time'),
-                'eventSource': 'aws.s3',
-                'awsRegion': event.get('region'),
-                'rawEvent': event
-            }
-        
-        logger.warning(f"Unsupported event structure: {json.dumps(event)}")
-        return None
+        if s3_event is None:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Unsupported event structure: %s", json_dumps(event))
+        return s3_event
         
     except Exception as e:
-        logger.error(f"Error extracting S3 event: {str(e)}")
+        logger.error("Error extracting S3 event: %s", e)
         return None
 
-def forward_to_destinations(s3_event: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-    """Forward S3 event to all configured destinations."""
-    results = {'successful': [], 'failed': [], 'total_processed': 0}
+def _lookup_extractor(extractors: Dict[str, _Extractor], discriminator: Any) -> Optional[_Extractor]:
+    """Look up an extractor, ignoring non-string discriminator values."""
+    if isinstance(discriminator, str):
+        return extractors.get(discriminator)
+    return None
+
+def forward_to_destinations(s3_event: S3Event, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Forward S3 event to all enabled destinations of a config normalized by _ensure_structure."""
+    results: Dict[str, Any] = {'successful': [], 'failed': [], 'total_processed': 0}
+    
+    # Each destination gets its own API call: SQS/SNS batch APIs only batch
+    # messages for a single queue/topic, so fan-out is parallelized instead
+    pending: List[Tuple[str, str, Future]] = []
+    pending_append = pending.append
+    submit = _EXECUTOR.submit
     
-    # Forward to SQS queues
-    queues = config.get('sqs_queues', [])
+    # Forward to enabled SQS queues
+    queues = config['sqs_enabled']
     if queues:
+        forward_sqs = forwarder.forward_to_sqs
         for queue_config in queues:
-            # Check if queue is enabled
-            if queue_config.get('enabled', True):  # Default to True if not specified
-                result = forwarder.forward_to_sqs(s3_event, queue_config)
-                _add_result(results, 'sqs', queue_config['name'], result)
-            else:
-                logger.info(f"Skipping disabled SQS queue: {queue_config.get('name', 'unknown')}")
+            pending_append(('sqs', queue_config.get('name', 'unknown'), submit(forward_sqs, s3_event, queue_config)))
     else:
-        logger.info("No SQS queues configured")
+        logger.info("No enabled SQS queues configured")
     
-    # Forward to SNS topics
-    topics = config.get('sns_topics', [])
+    # Forward to enabled SNS topics
+    topics = config['sns_enabled']
     if topics:
+        forward_sns = forwarder.forward_to_sns
         for topic_config in topics:
-            # Check if topic is enabled
-            if topic_config.get('enabled', True):  # Default to True if not specified
-                result = forwarder.forward_to_sns(s3_event, topic_config)
-                _add_result(results, 'sns', topic_config['name'], result)
-            else:
-                logger.info(f"Skipping disabled SNS topic: {topic_config.get('name', 'unknown')}")
+            pending_append(('sns', topic_config.get('name', 'unknown'), submit(forward_sns, s3_event, topic_config)))
     else:
-        logger.info("No SNS topics configured")
+        logger.info("No enabled SNS topics configured")
     
-    logger.info(f"Forwarded event to {len(results['successful'])} successful and {len(results['failed'])} failed destinations")
-    return results
-
-def _add_result(results: Dict[str, Any], dest_type: str, dest_name: str, result: Dict[str, Any]) -> None:
-    """Add forwarding result to results dictionary."""
-    results['total_processed'] += 1
-    if result['success']:
-        results['successful'].append({
-            'type': dest_type,
-            'destination': dest_name,
-            'message_id': result.get('message_id')
-        })
-    else:
-        results['failed'].append({
-            'type': dest_type,
-            'destination': dest_name,
-            'error': result.get('error')
-        }) 
\ No newline at end of file
+    # Collect results in submission order
+    successful_append = results['successful'].append
+    failed_append = results['failed'].append
+    for dest_type, dest_name, future in pending:
+        result = future.result()
+        if result['success']:
+            successful_append({'type': dest_type, 'destination': dest_name, 'message_id': result.get('message_id')})
+        else:
+            failed_append({'type': dest_type, 'destination': dest_name, 'error': result.get('error')})
+    results['total_processed'] = len(pending)
+    
+    logger.info("Forwarded event to %d successful and %d failed destinations", len(results['successful']), len(results['failed']))
+    return results
\ No newline at end of file
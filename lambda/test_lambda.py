@@ -12,6 +12,15 @@ import os
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Pretty-print JSON output only when TEST_VERBOSE=1
+VERBOSE = os.environ.get('TEST_VERBOSE') == '1'
+
+def _dump(obj):
+    """Serialize obj for diagnostic output."""
+    if VERBOSE:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
 def test_configuration():
     """Test the configuration loading functionality."""
     print("\n🔧 Testing Configuration Loading...")
@@ -22,44 +31,109 @@ def test_configuration():
         
         # Test default configuration
         config = get_destinations_config()
-        print(f"Loaded configuration: {json.dumps(config, indent=2)}")
+        print(f"Loaded configuration: {_dump(config)}")
+        
+        # Test configuration caching across invocations
+        cached = get_destinations_config() is config
+        print(f"{'✅' if cached else '❌'} Configuration cached between calls")
         
         # Test empty arrays configuration
         print("\nTesting empty arrays configuration...")
         empty_config = {"sqs_queues": [], "sns_topics": []}
         ensured_config = _ensure_structure(empty_config)
-        print(f"Empty config ensured: {json.dumps(ensured_config, indent=2)}")
+        print(f"Empty config ensured: {_dump(ensured_config)}")
         
         # Test partial configuration (missing arrays)
         print("\nTesting partial configuration...")
         partial_config = {"some_other_key": "value"}
         ensured_partial = _ensure_structure(partial_config)
-        print(f"Partial config ensured: {json.dumps(ensured_partial, indent=2)}")
+        print(f"Partial config ensured: {_dump(ensured_partial)}")
         
     except Exception as e:
         print(f"❌ Error testing configuration: {str(e)}")
 
+def test_configuration_cache():
+    """Test that the cached configuration is reloaded when its sources change."""
+    print("\n🗃️ Testing Configuration Cache Invalidation...")
+    print("=" * 50)
+    
+    env_vars = ('S3_FORWARDER_CONFIG', 'S3_FORWARDER_SQS_QUEUES', 'S3_FORWARDER_SNS_TOPICS')
+    saved_env = {name: os.environ.pop(name, None) for name in env_vars}
+    config_file = '/tmp/s3-forwarder-config.json'
+    created_file = False
+    
+    try:
+        import config
+        
+        def queue_names():
+            return [q['name'] for q in config.get_destinations_config()['sqs_queues']]
+        
+        # Environment variable change
+        config._reset_cache()
+        os.environ['S3_FORWARDER_SQS_QUEUES'] = '[{"name": "env-queue-1", "url": "http://test1"}]'
+        assert queue_names() == ['env-queue-1'], "initial env config not loaded"
+        assert config.get_destinations_config() is config.get_destinations_config(), "config not cached"
+        os.environ['S3_FORWARDER_SQS_QUEUES'] = '[{"name": "env-queue-2", "url": "http://test2"}]'
+        assert queue_names() == ['env-queue-2'], "config not reloaded after env change"
+        print("✅ Reloaded after S3_FORWARDER_SQS_QUEUES changed")
+        del os.environ['S3_FORWARDER_SQS_QUEUES']
+        
+        if os.path.exists(config_file):
+            print(f"⚠️ Skipping config file checks: {config_file} already exists")
+            return
+        
+        # Config file modification time change
+        config._reset_cache()
+        created_file = True
+        with open(config_file, 'w') as f:
+            json.dump({"sqs_queues": [{"name": "file-queue-1", "url": "http://test1"}]}, f)
+        os.utime(config_file, (1000000000, 1000000000))
+        assert queue_names() == ['file-queue-1'], "initial config file not loaded"
+        with open(config_file, 'w') as f:
+            json.dump({"sqs_queues": [{"name": "file-queue-2", "url": "http://test2"}]}, f)
+        os.utime(config_file, (1000000001, 1000000001))
+        assert queue_names() == ['file-queue-2'], "config not reloaded after file change"
+        print("✅ Reloaded after config file mtime changed")
+        
+        # Config file removed
+        os.remove(config_file)
+        assert queue_names() != ['file-queue-2'], "config not reloaded after file removal"
+        print("✅ Reloaded after config file was removed")
+        config._reset_cache()
+        
+    except AssertionError as e:
+        print(f"❌ Configuration cache check failed: {str(e)}")
+    except Exception as e:
+        print(f"❌ Error testing configuration cache: {str(e)}")
+    finally:
+        if created_file and os.path.exists(config_file):
+            os.remove(config_file)
+        for name, value in saved_env.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+
 def test_destinations():
     """Test the destinations module."""
     print("\n🎯 Testing Destinations Module...")
     print("=" * 50)
     
     try:
-        from destinations import DestinationForwarder
+        from destinations import DestinationForwarder, S3Event
         
         # Create forwarder instance
         forwarder = DestinationForwarder()
         print("✅ DestinationForwarder created successfully")
         
         # Test message preparation
-        s3_event = {
-            'eventName': 'ObjectCreated:Put',
-            'bucketName': 'test-bucket',
-            'objectKey': 'test/file.txt',
-            'eventTime': '2024-12-01T10:00:00.000Z',
-            'eventSource': 'aws:s3',
-            'awsRegion': 'us-east-1'
-        }
+        s3_event = S3Event(
+            eventName='ObjectCreated:Put',
+            bucketName='test-bucket',
+            objectKey='test/file.txt',
+            eventTime='2024-12-01T10:00:00.000Z',
+            eventSource='aws:s3',
+            awsRegion='us-east-1'
+        )
         
         queue_config = {
             'name': 'test-queue',
@@ -74,11 +148,11 @@ def test_destinations():
         
         # Test SQS message preparation
         sqs_message = forwarder._prepare_sqs_message(s3_event, queue_config)
-        print(f"SQS message prepared: {json.dumps(sqs_message, indent=2)}")
+        print(f"SQS message prepared: {_dump(sqs_message)}")
         
         # Test SNS message preparation
         sns_message = forwarder._prepare_sns_message(s3_event, topic_config)
-        print(f"SNS message prepared: {json.dumps(sns_message, indent=2)}")
+        print(f"SNS message prepared: {_dump(sns_message)}")
         
     except Exception as e:
         print(f"❌ Error testing destinations: {str(e)}")
@@ -110,7 +184,7 @@ def test_s3_event_forwarding():
         }
         
         result_1 = lambda_handler(test_event_1, None)
-        print(f"Result: {json.dumps(result_1, indent=2)}")
+        print(f"Result: {_dump(result_1)}")
         
         # Test 2: Empty Configuration
         print("\n2. Testing Empty Configuration...")
@@ -131,13 +205,13 @@ def test_s3_event_forwarding():
         }
         
         result_2 = lambda_handler(test_event_2, None)
-        print(f"Result: {json.dumps(result_2, indent=2)}")
+        print(f"Result: {_dump(result_2)}")
         
         # Test 3: Invalid Event
         print("\n3. Testing Invalid Event...")
         test_event_3 = {"invalid": "event"}
         result_3 = lambda_handler(test_event_3, None)
-        print(f"Result: {json.dumps(result_3, indent=2)}")
+        print(f"Result: {_dump(result_3)}")
         
     except Exception as e:
         print(f"❌ Error testing S3 event forwarding: {str(e)}")
@@ -147,6 +221,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     test_configuration()
+    test_configuration_cache()
     test_destinations()
     test_s3_event_forwarding()
     
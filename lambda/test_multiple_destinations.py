@@ -17,7 +17,7 @@ def test_multiple_destinations():
     
     try:
         from main import lambda_handler
-        from config import get_destinations_config
+        from config import get_destinations_config, _ensure_structure
         
         # Test configuration with multiple destinations
         test_config = {
@@ -88,7 +88,7 @@ def test_multiple_destinations():
         original_get_config = config.get_destinations_config
         
         def mock_get_config():
-            return test_config
+            return _ensure_structure(test_config)
         
         config.get_destinations_config = mock_get_config
         
@@ -148,6 +148,8 @@ def test_destination_processing_logic():
     
     try:
         from main import forward_to_destinations
+        from config import _ensure_structure
+        from destinations import S3Event
         
         # Test configuration
         test_config = {
@@ -161,19 +163,19 @@ def test_destination_processing_logic():
             ]
         }
         
-        test_s3_event = {
-            "eventName": "ObjectCreated:Put",
-            "bucketName": "test-bucket",
-            "objectKey": "test/file.txt",
-            "eventTime": "2024-12-01T10:00:00.000Z",
-            "eventSource": "aws:s3",
-            "awsRegion": "us-east-1"
-        }
+        test_s3_event = S3Event(
+            eventName="ObjectCreated:Put",
+            bucketName="test-bucket",
+            objectKey="test/file.txt",
+            eventTime="2024-12-01T10:00:00.000Z",
+            eventSource="aws:s3",
+            awsRegion="us-east-1"
+        )
         
         print(f"Testing with {len(test_config['sqs_queues'])} SQS queues and {len(test_config['sns_topics'])} SNS topics")
         
         # Test the forwarding logic
-        results = forward_to_destinations(test_s3_event, test_config)
+        results = forward_to_destinations(test_s3_event, _ensure_structure(test_config))
         
         print(f"Results:")
         print(f"  Total Processed: {results.get('total_processed', 0)}")
@@ -248,8 +250,8 @@ def test_configuration_structure():
             sqs_count = len(ensured_config.get('sqs_queues', []))
             sns_count = len(ensured_config.get('sns_topics', []))
             
-            print(f"  SQS Queues: {sqs_count}")
-            print(f"  SNS Topics: {sns_count}")
+            print(f"  SQS Queues: {sqs_count} ({len(ensured_config['sqs_enabled'])} enabled)")
+            print(f"  SNS Topics: {sns_count} ({len(ensured_config['sns_enabled'])} enabled)")
             
             # Verify structure
             if isinstance(ensured_config.get('sqs_queues'), list) and isinstance(ensured_config.get('sns_topics'), list):
@@ -267,6 +269,8 @@ def test_enabled_field_functionality():
     
     try:
         from main import forward_to_destinations
+        from config import _ensure_structure
+        from destinations import S3Event
         
         # Test configuration with mixed enabled/disabled destinations
         test_config = {
@@ -282,21 +286,21 @@ def test_enabled_field_functionality():
             ]
         }
         
-        test_s3_event = {
-            "eventName": "ObjectCreated:Put",
-            "bucketName": "test-bucket",
-            "objectKey": "test/file.txt",
-            "eventTime": "2024-12-01T10:00:00.000Z",
-            "eventSource": "aws:s3",
-            "awsRegion": "us-east-1"
-        }
+        test_s3_event = S3Event(
+            eventName="ObjectCreated:Put",
+            bucketName="test-bucket",
+            objectKey="test/file.txt",
+            eventTime="2024-12-01T10:00:00.000Z",
+            eventSource="aws:s3",
+            awsRegion="us-east-1"
+        )
         
         print(f"Testing with mixed enabled/disabled destinations:")
         print(f"  - SQS Queues: 2 enabled, 1 disabled")
         print(f"  - SNS Topics: 2 enabled, 1 disabled")
         
         # Test the forwarding logic
-        results = forward_to_destinations(test_s3_event, test_config)
+        results = forward_to_destinations(test_s3_event, _ensure_structure(test_config))
         
         print(f"\nResults:")
         print(f"  Total Processed: {results.get('total_processed', 0)}")